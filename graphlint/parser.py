@@ -45,14 +45,16 @@ class CheckType(str, Enum):
     UNIQUE_LANG = "unique_lang"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RelationshipTarget:
     type: str  # relationship type in LPG (e.g. "HAS_COMPONENT")
     direction: str  # "outgoing" or "incoming"
     target_label: str  # target node label
 
 
-@dataclass
+# Frozen for safe sharing, not speed: frozen __init__ assigns each field via
+# object.__setattr__, which makes construction roughly 4x slower.
+@dataclass(frozen=True, slots=True)
 class Check:
     id: str
     type: CheckType
@@ -182,7 +184,7 @@ XSD_TO_LPG_TYPE = {
 # ─── Validation Plan ─────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationPlan:
     schema_source: str
     checks: list[Check]
@@ -12,7 +12,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
 from graphlint.parser import ValidationPlan, Check, CheckType, Severity
 from graphlint.backends import Backend
@@ -151,16 +151,37 @@ def compile_plan(
     return results
 
 
-def dry_run(plan: ValidationPlan, backend: Backend) -> str:
+def dry_run_iter(
+    plan: ValidationPlan,
+    backend: Backend,
+    *,
+    precompiled: Optional[list[tuple[Check, str]]] = None,
+) -> Iterator[str]:
+    """Yield dry-run output lines, compiling each check as it is reached.
+
+    Each query is yielded as a single (possibly multi-line) string. Pass
+    *precompiled* (the output of ``compile_plan``) to reuse queries that were
+    already compiled for this plan instead of compiling them again.
+    """
+    if precompiled is None:
+        pairs = ((check, backend.compile_check(check)) for check in plan.checks)
+    else:
+        pairs = iter(precompiled)
+    for check, query in pairs:
+        yield f"-- [{check.severity.value.upper()}] {check.id}"
+        yield f"-- {check.message}"
+        yield query
+        yield ""
+
+
+def dry_run(
+    plan: ValidationPlan,
+    backend: Backend,
+    *,
+    precompiled: Optional[list[tuple[Check, str]]] = None,
+) -> str:
     """Return all compiled queries as a formatted string."""
-    compiled = compile_plan(plan, backend)
-    lines = []
-    for check, query in compiled:
-        lines.append(f"-- [{check.severity.value.upper()}] {check.id}")
-        lines.append(f"-- {check.message}")
-        lines.append(query)
-        lines.append("")
-    return "\n".join(lines)
+    return "\n".join(dry_run_iter(plan, backend, precompiled=precompiled))
 
 
 # ─── Execute against Neo4j ───────────────────────────────────────────
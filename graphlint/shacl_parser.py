@@ -8,11 +8,13 @@ the graph to produce Check objects for validation.
 from __future__ import annotations
 
 import warnings
-from typing import Optional
+from dataclasses import replace
+from typing import Iterator, Optional
 
 from rdflib import Graph, URIRef, Literal as RDFLiteral, RDF, RDFS, BNode
 from rdflib.collection import Collection
 from rdflib.namespace import SH
+from rdflib.term import Node
 
 from graphlint.parser import (
     Check,
@@ -27,6 +29,16 @@ from graphlint.parser import (
 )
 
 
+# SHACL severity IRIs that differ from the sh:Violation default
+_SEV_MAP: dict[str, Severity] = {
+    str(SH.Warning): Severity.WARNING,
+    str(SH.Info): Severity.INFO,
+}
+
+# sh:nodeKind values that mark a property shape as a relationship
+_REL_NODE_KINDS = frozenset({str(SH.IRI), str(SH.BlankNodeOrIRI)})
+
+
 def parse_shacl_to_plan(
     turtle: str,
     mapping: Optional[Mapping] = None,
@@ -68,12 +80,13 @@ def parse_shacl_to_plan(
 
             # Process each sh:property block
             for prop_node in g.objects(shape_node, SH.property):
-                path = g.value(prop_node, SH.path)
+                po = _predicate_objects(g, prop_node)
+                path = po.get(SH.path)
                 if path is not None and isinstance(path, URIRef):
                     declared_paths.append(str(path))
                 checks.extend(
                     _process_property_shape(
-                        g, prop_node, shape_iri, label, mapping, class_hierarchy
+                        g, prop_node, po, shape_iri, label, mapping, class_hierarchy
                     )
                 )
 
@@ -161,20 +174,35 @@ def _collect_descendants(cls: str, children: dict[str, list[str]]) -> list[str]:
 # ── Property shape processing ────────────────────────────────────
 
 
+def _predicate_objects(g: Graph, node) -> dict[URIRef, Node]:
+    """Map each predicate on *node* to its object in one scan of the graph.
+
+    setdefault keeps the first object, matching g.value()'s behaviour.
+    """
+    po: dict[URIRef, Node] = {}
+    for pred, obj in g.predicate_objects(node):
+        po.setdefault(pred, obj)
+    return po
+
+
 def _process_property_shape(
     g: Graph,
     prop_node,
+    po: dict[URIRef, Node],
     shape_iri: str,
     label: str,
     mapping: Mapping,
     class_hierarchy: dict[str, list[str]],
-) -> list[Check]:
-    """Process a single sh:property shape into one or more Checks."""
+) -> Iterator[Check]:
+    """Process a single sh:property shape, yielding one or more Checks.
+
+    *po* is the shape's predicate -> object map from _predicate_objects().
+    """
 
     # Extract path (required)
-    path = g.value(prop_node, SH.path)
+    path = po.get(SH.path)
     if path is None:
-        return []
+        return
 
     # Handle sh:inversePath
     direction = "outgoing"
@@ -187,41 +215,41 @@ def _process_property_shape(
             warnings.warn(
                 f"Complex sh:path in shape {shape_iri} is not yet supported, skipping."
             )
-            return []
+            return
 
     if not isinstance(path, URIRef):
         warnings.warn(
             f"Complex sh:path in shape {shape_iri} is not yet supported, skipping."
         )
-        return []
+        return
 
     predicate_iri = str(path)
 
     # Cardinality — SHACL defaults: minCount=0, maxCount=unbounded
-    min_count_lit = g.value(prop_node, SH.minCount)
-    max_count_lit = g.value(prop_node, SH.maxCount)
+    min_count_lit = po.get(SH.minCount)
+    max_count_lit = po.get(SH.maxCount)
     min_count = int(min_count_lit) if min_count_lit is not None else 0
     max_count = int(max_count_lit) if max_count_lit is not None else None
 
     # Severity
-    sev_iri = g.value(prop_node, SH.severity)
+    sev_iri = po.get(SH.severity)
     severity = _shacl_severity(sev_iri)
 
     # Distinguish property vs relationship
-    node_kind = g.value(prop_node, SH.nodeKind)
-    sh_node = g.value(prop_node, SH.node)
-    sh_class = g.value(prop_node, SH["class"])
-    sh_datatype = g.value(prop_node, SH.datatype)
+    node_kind = po.get(SH.nodeKind)
+    sh_node = po.get(SH.node)
+    sh_class = po.get(SH["class"])
+    sh_datatype = po.get(SH.datatype)
 
     if _is_relationship_constraint(node_kind, sh_node, sh_class, sh_datatype):
-        return _relationship_checks(
+        yield from _relationship_checks(
             g, prop_node, shape_iri, label, predicate_iri,
             min_count, max_count, severity, sh_node, sh_class, mapping,
             direction, class_hierarchy,
         )
     else:
-        return _property_checks(
-            g, prop_node, shape_iri, label, predicate_iri,
+        yield from _property_checks(
+            g, po, shape_iri, label, predicate_iri,
             min_count, max_count, severity, sh_datatype, mapping,
         )
 
@@ -229,7 +257,7 @@ def _process_property_shape(
 def _is_relationship_constraint(node_kind, sh_node, sh_class, sh_datatype) -> bool:
     """Determine if a property shape describes a relationship (not a property)."""
     if node_kind is not None:
-        return str(node_kind) in (str(SH.IRI), str(SH.BlankNodeOrIRI))
+        return str(node_kind) in _REL_NODE_KINDS
     if sh_node is not None or sh_class is not None:
         return True
     if sh_datatype is not None:
@@ -239,7 +267,7 @@ def _is_relationship_constraint(node_kind, sh_node, sh_class, sh_datatype) -> bo
 
 def _property_checks(
     g: Graph,
-    prop_node,
+    po: dict[URIRef, Node],
     shape_iri: str,
     label: str,
     predicate_iri: str,
@@ -254,11 +282,12 @@ def _property_checks(
     checks: list[Check] = []
     prop_name = mapping.property_for(predicate_iri)
     is_optional = min_count == 0
+    ll = label.lower()
 
     # Existence check
     if not is_optional:
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-exists",
+            id=f"{ll}-{prop_name}-exists",
             type=CheckType.PROPERTY_EXISTS,
             shape=shape_iri,
             target_label=label,
@@ -272,7 +301,7 @@ def _property_checks(
         dt_str = str(sh_datatype)
         lpg_type = XSD_TO_LPG_TYPE.get(dt_str, Mapping._local_name(dt_str))
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-type",
+            id=f"{ll}-{prop_name}-type",
             type=CheckType.PROPERTY_TYPE,
             shape=shape_iri,
             target_label=label,
@@ -284,11 +313,11 @@ def _property_checks(
         ))
 
     # Value set — sh:in is an RDF list
-    sh_in = g.value(prop_node, SH["in"])
+    sh_in = po.get(SH["in"])
     if sh_in is not None:
         allowed = _extract_rdf_list(g, sh_in)
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-values",
+            id=f"{ll}-{prop_name}-values",
             type=CheckType.PROPERTY_VALUE_IN,
             shape=shape_iri,
             target_label=label,
@@ -300,14 +329,14 @@ def _property_checks(
         ))
 
     # sh:hasValue — reuses PROPERTY_VALUE_IN with single value
-    sh_has_value = g.value(prop_node, SH.hasValue)
+    sh_has_value = po.get(SH.hasValue)
     if sh_has_value is not None:
         if isinstance(sh_has_value, RDFLiteral):
             val = sh_has_value.toPython()
         else:
             val = str(sh_has_value)
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-hasvalue",
+            id=f"{ll}-{prop_name}-hasvalue",
             type=CheckType.PROPERTY_VALUE_IN,
             shape=shape_iri,
             target_label=label,
@@ -319,13 +348,13 @@ def _property_checks(
         ))
 
     # sh:pattern — regex constraint
-    sh_pattern = g.value(prop_node, SH.pattern)
+    sh_pattern = po.get(SH.pattern)
     if sh_pattern is not None:
         pattern_str = str(sh_pattern)
-        sh_flags = g.value(prop_node, SH.flags)
+        sh_flags = po.get(SH.flags)
         flags_str = str(sh_flags) if sh_flags is not None else None
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-pattern",
+            id=f"{ll}-{prop_name}-pattern",
             type=CheckType.PROPERTY_PATTERN,
             shape=shape_iri,
             target_label=label,
@@ -338,8 +367,8 @@ def _property_checks(
         ))
 
     # sh:minLength / sh:maxLength — string length constraint
-    sh_min_len = g.value(prop_node, SH.minLength)
-    sh_max_len = g.value(prop_node, SH.maxLength)
+    sh_min_len = po.get(SH.minLength)
+    sh_max_len = po.get(SH.maxLength)
     if sh_min_len is not None or sh_max_len is not None:
         min_len = int(sh_min_len) if sh_min_len is not None else None
         max_len = int(sh_max_len) if sh_max_len is not None else None
@@ -349,7 +378,7 @@ def _property_checks(
         if max_len is not None:
             msg_parts.append(f"at most {max_len}")
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-strlen",
+            id=f"{ll}-{prop_name}-strlen",
             type=CheckType.PROPERTY_STRING_LENGTH,
             shape=shape_iri,
             target_label=label,
@@ -362,10 +391,10 @@ def _property_checks(
         ))
 
     # sh:minInclusive / sh:maxInclusive / sh:minExclusive / sh:maxExclusive
-    sh_min_inc = g.value(prop_node, SH.minInclusive)
-    sh_max_inc = g.value(prop_node, SH.maxInclusive)
-    sh_min_exc = g.value(prop_node, SH.minExclusive)
-    sh_max_exc = g.value(prop_node, SH.maxExclusive)
+    sh_min_inc = po.get(SH.minInclusive)
+    sh_max_inc = po.get(SH.maxInclusive)
+    sh_min_exc = po.get(SH.minExclusive)
+    sh_max_exc = po.get(SH.maxExclusive)
     if any(v is not None for v in (sh_min_inc, sh_max_inc, sh_min_exc, sh_max_exc)):
         min_inc = float(sh_min_inc.toPython()) if sh_min_inc is not None else None
         max_inc = float(sh_max_inc.toPython()) if sh_max_inc is not None else None
@@ -381,7 +410,7 @@ def _property_checks(
         if max_exc is not None:
             msg_parts.append(f"< {max_exc}")
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-range",
+            id=f"{ll}-{prop_name}-range",
             type=CheckType.PROPERTY_RANGE,
             shape=shape_iri,
             target_label=label,
@@ -402,11 +431,11 @@ def _property_checks(
         (SH.lessThan, "lessThan"),
         (SH.lessThanOrEquals, "lessThanOrEquals"),
     ]:
-        comp_val = g.value(prop_node, pred)
+        comp_val = po.get(pred)
         if comp_val is not None:
             comp_prop = mapping.property_for(str(comp_val))
             checks.append(Check(
-                id=f"{label.lower()}-{prop_name}-{comp_type.lower()}",
+                id=f"{ll}-{prop_name}-{comp_type.lower()}",
                 type=CheckType.PROPERTY_PAIR,
                 shape=shape_iri,
                 target_label=label,
@@ -419,14 +448,14 @@ def _property_checks(
             ))
 
     # sh:uniqueLang — not applicable to LPG
-    sh_unique_lang = g.value(prop_node, SH.uniqueLang)
+    sh_unique_lang = po.get(SH.uniqueLang)
     if sh_unique_lang is not None and sh_unique_lang.toPython() is True:
         warnings.warn(
             f"sh:uniqueLang on {predicate_iri} in {shape_iri}: "
             "LPG has no native language tags; constraint acknowledged but cannot be enforced."
         )
         checks.append(Check(
-            id=f"{label.lower()}-{prop_name}-uniquelang",
+            id=f"{ll}-{prop_name}-uniquelang",
             type=CheckType.UNIQUE_LANG,
             shape=shape_iri,
             target_label=label,
@@ -439,8 +468,8 @@ def _property_checks(
         ))
 
     # Annotation properties — metadata only, no queries
-    sh_default = g.value(prop_node, SH.defaultValue)
-    sh_order = g.value(prop_node, SH.order)
+    sh_default = po.get(SH.defaultValue)
+    sh_order = po.get(SH.order)
     default_val = None
     order_val = None
     if sh_default is not None:
@@ -454,14 +483,15 @@ def _property_checks(
             # Attach to last check for this property
             last = checks[-1]
             if last.property == prop_name:
-                last.default_value = default_val
-                last.display_order = order_val
+                checks[-1] = replace(
+                    last, default_value=default_val, display_order=order_val
+                )
 
     # sh:qualifiedValueShape — qualified cardinality
-    qvs = g.value(prop_node, SH.qualifiedValueShape)
+    qvs = po.get(SH.qualifiedValueShape)
     if qvs is not None:
-        q_min_lit = g.value(prop_node, SH.qualifiedMinCount)
-        q_max_lit = g.value(prop_node, SH.qualifiedMaxCount)
+        q_min_lit = po.get(SH.qualifiedMinCount)
+        q_max_lit = po.get(SH.qualifiedMaxCount)
         q_min = int(q_min_lit) if q_min_lit is not None else None
         q_max = int(q_max_lit) if q_max_lit is not None else None
 
@@ -473,7 +503,7 @@ def _property_checks(
             if q_max is not None:
                 msg_parts.append(f"at most {q_max}")
             checks.append(Check(
-                id=f"{label.lower()}-{prop_name}-qualified",
+                id=f"{ll}-{prop_name}-qualified",
                 type=CheckType.QUALIFIED_CARDINALITY,
                 shape=shape_iri,
                 target_label=label,
@@ -502,10 +532,9 @@ def _relationship_checks(
     mapping: Mapping,
     direction: str = "outgoing",
     class_hierarchy: dict[str, list[str]] | None = None,
-) -> list[Check]:
+) -> Iterator[Check]:
     """Generate relationship cardinality checks."""
 
-    checks: list[Check] = []
     rel_type = mapping.relationship_for(predicate_iri)
 
     # Resolve target label(s)
@@ -540,7 +569,7 @@ def _relationship_checks(
     # renders it as a schema fact rather than a pass/fail card.
     check_severity = Severity.INFO if (min_count == 0 and max_count is None) else severity
 
-    checks.append(Check(
+    yield Check(
         id=f"{label.lower()}-{rel_type.lower()}-cardinality",
         type=CheckType.RELATIONSHIP_CARDINALITY,
         shape=shape_iri,
@@ -555,9 +584,7 @@ def _relationship_checks(
         min_count=min_count,
         max_count=max_count,
         acceptable_labels=acceptable,
-    ))
-
-    return checks
+    )
 
 
 def _extract_or_classes(
@@ -875,9 +902,4 @@ def _shacl_severity(sev_iri) -> Severity:
     """Map SHACL severity IRI to graphlint Severity enum."""
     if sev_iri is None:
         return Severity.VIOLATION  # SHACL default
-    sev_str = str(sev_iri)
-    if sev_str == str(SH.Warning):
-        return Severity.WARNING
-    if sev_str == str(SH.Info):
-        return Severity.INFO
-    return Severity.VIOLATION
+    return _SEV_MAP.get(str(sev_iri), Severity.VIOLATION)
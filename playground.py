@@ -4,11 +4,19 @@ graphlint playground — Interactive web UI for testing SHACL schemas.
 Run with: uv run python playground.py
 """
 
+import asyncio
+import atexit
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from neo4j import Driver, GraphDatabase
+from neo4j.exceptions import AuthError, ServiceUnavailable
 from pydantic import BaseModel
 
 from graphlint.parser import parse_schema
@@ -18,7 +26,58 @@ from graphlint.runner import dry_run, execute_plan
 app = FastAPI()
 templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
 
-EXAMPLE_SHACL = (Path(__file__).parent / "examples" / "movies.shacl.ttl").read_text()
+# Schema parsing is CPU-bound; give it its own threads so a burst of
+# compiles can't starve /api/validate, which mostly waits on the database.
+_COMPILE_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="compile",
+)
+
+
+@functools.cache
+def _example_shacl() -> str:
+    """Read the bundled example schema on first use rather than at import."""
+    return (Path(__file__).parent / "examples" / "movies.shacl.ttl").read_text(encoding="utf-8")
+
+
+# Neo4j drivers keyed by (uri, username, password). A driver owns its own
+# connection pool, so reusing it skips the handshake and routing discovery
+# that a fresh GraphDatabase.driver() pays on every validation.
+# The playground is a single-user dev tool, so the pool is unbounded. A
+# driver that fails is only retired from the pool, not closed, because a
+# concurrent validation may still hold it; retired drivers close at exit.
+_DRIVER_POOL: dict[tuple[str, str, str], Driver] = {}
+_RETIRED_DRIVERS: list[Driver] = []
+_POOL_LOCK = threading.Lock()
+
+
+def _get_driver(uri: str, username: str, password: str) -> Driver:
+    key = (uri, username, password)
+    with _POOL_LOCK:
+        driver = _DRIVER_POOL.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(uri, auth=(username, password))
+            _DRIVER_POOL[key] = driver
+        return driver
+
+
+def _retire_driver(uri: str, username: str, password: str, driver: Driver) -> None:
+    """Stop handing out a driver that failed to connect or authenticate, so
+    the next request with the same settings gets a fresh one."""
+    with _POOL_LOCK:
+        if _DRIVER_POOL.get((uri, username, password)) is driver:
+            del _DRIVER_POOL[(uri, username, password)]
+            _RETIRED_DRIVERS.append(driver)
+
+
+@atexit.register
+def _close_drivers() -> None:
+    with _POOL_LOCK:
+        drivers = list(_DRIVER_POOL.values()) + _RETIRED_DRIVERS
+        _DRIVER_POOL.clear()
+        _RETIRED_DRIVERS.clear()
+    for driver in drivers:
+        driver.close()
 
 
 class CompileRequest(BaseModel):
@@ -37,16 +96,13 @@ class ValidateRequest(BaseModel):
     database_type: str = "neo4j"
 
 
-@app.post("/api/validate")
-def validate_schema(req: ValidateRequest):
+def _validate(req: ValidateRequest) -> dict:
+    plan = parse_schema(
+        req.schema, source="<playground>", strict=req.strict
+    )
+    backend = CypherBackend(dialect=req.database_type)
+    driver = _get_driver(req.bolt_uri, req.username, req.password)
     try:
-        from neo4j import GraphDatabase
-
-        plan = parse_schema(
-            req.schema, source="<playground>", strict=req.strict
-        )
-        backend = CypherBackend(dialect=req.database_type)
-        driver = GraphDatabase.driver(req.bolt_uri, auth=(req.username, req.password))
         report = execute_plan(
             plan,
             backend,
@@ -54,25 +110,38 @@ def validate_schema(req: ValidateRequest):
             database=req.database or None,
             target_uri=req.bolt_uri,
         )
-        driver.close()
-        return {"ok": True, "report": report.to_dict()}
+    except (ServiceUnavailable, AuthError):
+        _retire_driver(req.bolt_uri, req.username, req.password, driver)
+        raise
+    return {"ok": True, "report": report.to_dict()}
+
+
+def _compile(req: CompileRequest) -> dict:
+    plan = parse_schema(
+        req.schema, source="<playground>", strict=req.strict
+    )
+    backend = CypherBackend(dialect=req.database_type)
+    cypher = dry_run(plan, backend)
+    return {
+        "ok": True,
+        "plan": plan.to_dict(),
+        "cypher": cypher,
+    }
+
+
+@app.post("/api/validate")
+async def validate_schema(req: ValidateRequest):
+    try:
+        return await asyncio.to_thread(_validate, req)
     except Exception as e:
         return {"ok": False, "error": f"{type(e).__name__}: {e}"}
 
 
 @app.post("/api/compile")
-def compile_schema(req: CompileRequest):
+async def compile_schema(req: CompileRequest):
     try:
-        plan = parse_schema(
-            req.schema, source="<playground>", strict=req.strict
-        )
-        backend = CypherBackend(dialect=req.database_type)
-        cypher = dry_run(plan, backend)
-        return {
-            "ok": True,
-            "plan": plan.to_dict(),
-            "cypher": cypher,
-        }
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_COMPILE_POOL, _compile, req)
     except Exception as e:
         return {
             "ok": False,
@@ -80,15 +149,16 @@ def compile_schema(req: CompileRequest):
         }
 
 
+@functools.cache
+def _index_html() -> bytes:
+    """Render the playground page once; its only input is the example schema."""
+    template = templates.get_template("playground.html")
+    return template.render(example_shacl=_example_shacl()).encode("utf-8")
+
+
 @app.get("/", response_class=HTMLResponse)
-def index(request: Request):
-    return templates.TemplateResponse(
-        "playground.html",
-        {
-            "request": request,
-            "example_shacl": EXAMPLE_SHACL,
-        },
-    )
+def index():
+    return HTMLResponse(content=_index_html())
 
 
 if __name__ == "__main__":
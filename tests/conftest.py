@@ -1,11 +1,106 @@
+from collections import defaultdict
+from dataclasses import dataclass
+
 import pytest
 
+from graphlint.parser import Check, CheckType, ValidationPlan
+from graphlint.shacl_parser import parse_shacl_to_plan
+from graphlint.backends.cypher import CypherBackend
+from graphlint.backends.gql import GQLBackend
+from graphlint.runner import compile_plan
+
+
+@dataclass
+class PlanIndex:
+    """A plan's checks bucketed by type, property, and (label, property).
+
+    Buckets are plain dicts, so a lookup for a missing key raises KeyError
+    instead of inserting into the session-shared index.
+    """
 
-@pytest.fixture
+    by_type: dict[CheckType, list[Check]]
+    by_property: dict[str, list[Check]]
+    by_label_property: dict[tuple[str, str], list[Check]]
+
+    @classmethod
+    def build(cls, plan: ValidationPlan) -> "PlanIndex":
+        by_type = defaultdict(list)
+        by_property = defaultdict(list)
+        by_label_property = defaultdict(list)
+        for c in plan.checks:
+            by_type[c.type].append(c)
+            if c.property:
+                by_property[c.property].append(c)
+                by_label_property[(c.target_label, c.property)].append(c)
+        return cls(dict(by_type), dict(by_property), dict(by_label_property))
+
+
+@pytest.fixture(scope="session")
 def examples_dir(request):
     return request.config.rootpath / "examples"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def movies_shacl(examples_dir):
-    return (examples_dir / "movies.shacl.ttl").read_text()
+    return (examples_dir / "movies.shacl.ttl").read_text(encoding="utf-8")
+
+
+# Parsed plans are shared across the session; tests must treat them as read-only.
+
+@pytest.fixture(scope="session")
+def movies_shacl_plan(movies_shacl):
+    return parse_shacl_to_plan(movies_shacl, source="movies.shacl.ttl")
+
+
+@pytest.fixture(scope="session")
+def movies_shacl_plan_strict(movies_shacl):
+    return parse_shacl_to_plan(movies_shacl, source="movies.shacl.ttl", strict=True)
+
+
+@pytest.fixture(scope="session")
+def plan_index(movies_shacl_plan):
+    return PlanIndex.build(movies_shacl_plan)
+
+
+@pytest.fixture(scope="session")
+def movies_labels(movies_shacl_plan):
+    """Shape IRI -> node label for the movies plan."""
+    label_for = movies_shacl_plan.mapping.label_for
+    return {s: label_for(s) for s in movies_shacl_plan.shapes}
+
+
+# Backend compilation is pure, so the (check, query) pairs are shared too.
+
+@pytest.fixture(scope="session")
+def cypher_compiled(movies_shacl_plan):
+    return compile_plan(movies_shacl_plan, CypherBackend())
+
+
+@pytest.fixture(scope="session")
+def gql_compiled(movies_shacl_plan):
+    return compile_plan(movies_shacl_plan, GQLBackend())
+
+
+# Compiled queries starting with these are comment-only no-ops (e.g.
+# sh:uniqueLang), not runnable Cypher/GQL.
+_NOOP_QUERY_PREFIXES = ("//",)
+
+
+def _runnable(compiled: list[tuple[Check, str]]) -> list[tuple[Check, str]]:
+    return [(c, q) for c, q in compiled if not q.startswith(_NOOP_QUERY_PREFIXES)]
+
+
+@pytest.fixture(scope="session")
+def runnable():
+    """The no-op filter, for tests that compile their own inline plans."""
+    return _runnable
+
+
+@pytest.fixture(scope="session")
+def cypher_runnable(cypher_compiled):
+    return _runnable(cypher_compiled)
+
+
+@pytest.fixture(scope="session")
+def gql_runnable(gql_compiled):
+    return _runnable(gql_compiled)
@@ -2,29 +2,73 @@
 Test the SHACL pipeline: SHACL/Turtle -> IR -> Cypher/GQL
 """
 
+import re
+import warnings
+from collections import Counter
+from operator import attrgetter
+
+import pytest
+
 from graphlint.shacl_parser import parse_shacl_to_plan
-from graphlint.parser import parse_schema, CheckType, Severity
+from graphlint.parser import parse_schema, CheckType, Severity, Mapping
 from graphlint.backends.cypher import CypherBackend
 from graphlint.backends.gql import GQLBackend
-from graphlint.runner import compile_plan, dry_run
+from graphlint.runner import compile_plan, dry_run, dry_run_iter
 
 
-def test_shacl_parser_shapes(movies_shacl):
-    """Parse movies.shacl.ttl and verify we get the expected shapes."""
-    plan = parse_shacl_to_plan(movies_shacl, source="movies.shacl.ttl")
+# A runnable Cypher query matches, then returns a node_id / rel_id row.
+_CYPHER_SHAPE = re.compile(r"MATCH\b[\s\S]+\bRETURN\b[\s\S]+\b(?:node_id|rel_id)\b")
+# GQL uses id(), never Cypher's elementId().
+_GQL_REQUIRED = ("id(n)", "id(startNode(")
+_GQL_FORBIDDEN = ("elementId",)
 
-    assert len(plan.shapes) == 4
-    labels = {plan.mapping.label_for(s) for s in plan.shapes}
-    assert labels == {"Movie", "Person", "Genre", "Review"}
+# Node labels declared by examples/movies.shacl.ttl.
+_EXPECTED_LABELS = frozenset({"Movie", "Person", "Genre", "Review"})
+
+# Backends hold no per-query state, so one instance of each serves every test.
+_CYPHER = CypherBackend()
+_GQL = GQLBackend()
 
+# Convention-only mapping shared by tests that don't need overrides.
+_MAPPING = Mapping()
 
-def test_shacl_check_types(movies_shacl):
+# Sentinel for _exactly_one; distinct from any value a check lookup can yield.
+_MISSING = object()
+
+# Prefix preamble shared by the inline Turtle documents below.
+_PREFIXES = """\
+    @prefix sh:   <http://www.w3.org/ns/shacl#> .
+    @prefix ex:   <http://example.org/test#> .
+    @prefix xsd:  <http://www.w3.org/2001/XMLSchema#> .
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+"""
+
+
+def _quick_plan(body, **kwargs):
+    """Parse an inline Turtle body (without prefixes) into a ValidationPlan."""
+    return parse_shacl_to_plan(_PREFIXES + body, **kwargs)
+
+
+def _exactly_one(iterable, what="check"):
+    """Return the single item of *iterable*, stopping at the second match."""
+    it = iter(iterable)
+    first = next(it, _MISSING)
+    assert first is not _MISSING, f"expected one {what}, got none"
+    assert next(it, _MISSING) is _MISSING, f"expected one {what}, got several"
+    return first
+
+
+def test_shacl_parser_shapes(movies_shacl_plan, movies_labels):
+    """Parse movies.shacl.ttl and verify we get the expected shapes."""
+    assert len(movies_shacl_plan.shapes) == 4
+    assert set(movies_labels.values()) == _EXPECTED_LABELS
+
+
+def test_shacl_check_types(movies_shacl_plan):
     """Verify all expected check types are generated."""
-    plan = parse_shacl_to_plan(movies_shacl)
+    plan = movies_shacl_plan
 
-    type_counts = {}
-    for c in plan.checks:
-        type_counts[c.type] = type_counts.get(c.type, 0) + 1
+    type_counts = Counter(c.type for c in plan.checks)
 
     assert type_counts.get(CheckType.PROPERTY_EXISTS, 0) > 0
     assert type_counts.get(CheckType.PROPERTY_TYPE, 0) > 0
@@ -32,118 +76,132 @@ def test_shacl_check_types(movies_shacl):
     assert type_counts.get(CheckType.RELATIONSHIP_CARDINALITY, 0) > 0
 
 
-def test_shacl_optional_property(movies_shacl):
+def test_shacl_optional_property(plan_index):
     """Optional properties (no sh:minCount) skip existence check but still type-check."""
-    plan = parse_shacl_to_plan(movies_shacl)
-
     # Person.born is optional (no sh:minCount)
-    born_checks = [c for c in plan.checks if c.property == "born"]
-    exists_checks = [c for c in born_checks if c.type == CheckType.PROPERTY_EXISTS]
-    type_checks = [c for c in born_checks if c.type == CheckType.PROPERTY_TYPE]
-
-    assert len(exists_checks) == 0, "Optional property should not have existence check"
-    assert len(type_checks) == 1, "Should have type check for optional property"
-    assert type_checks[0].only_if_exists is True
+    born_checks = plan_index.by_property["born"]
+    born_exists = any(c.type == CheckType.PROPERTY_EXISTS for c in born_checks)
+    assert not born_exists, "Optional property should not have existence check"
+    born_type = _exactly_one(
+        (c for c in born_checks if c.type == CheckType.PROPERTY_TYPE), "born type check"
+    )
+    assert born_type.only_if_exists is True
 
     # Movie.title is required (sh:minCount 1)
-    title_checks = [
-        c for c in plan.checks
-        if c.property == "title" and c.target_label == "Movie"
-    ]
-    title_exists = [c for c in title_checks if c.type == CheckType.PROPERTY_EXISTS]
-    assert len(title_exists) == 1, "Required property should have existence check"
+    title_checks = plan_index.by_label_property[("Movie", "title")]
+    _exactly_one(
+        (c for c in title_checks if c.type == CheckType.PROPERTY_EXISTS), "title existence check"
+    )
 
 
-def test_shacl_value_set(movies_shacl):
+def test_shacl_value_set(plan_index):
     """sh:in produces PROPERTY_VALUE_IN check with correct allowed values."""
-    plan = parse_shacl_to_plan(movies_shacl)
-
-    rating_checks = [
-        c for c in plan.checks
-        if c.property == "rating" and c.type == CheckType.PROPERTY_VALUE_IN
-    ]
+    rating = _exactly_one(
+        c for c in plan_index.by_property["rating"]
+        if c.type == CheckType.PROPERTY_VALUE_IN
+    )
 
-    assert len(rating_checks) == 1
-    assert rating_checks[0].only_if_exists is True
-    assert "G" in rating_checks[0].allowed_values
-    assert "R" in rating_checks[0].allowed_values
-    assert "NC-17" in rating_checks[0].allowed_values
+    assert rating.only_if_exists is True
+    assert "G" in rating.allowed_values
+    assert "R" in rating.allowed_values
+    assert "NC-17" in rating.allowed_values
 
 
-def test_shacl_cardinality_variations(movies_shacl):
+def test_shacl_cardinality_variations(plan_index):
     """Verify cardinality: 1..*, 1..1, 0..1."""
-    plan = parse_shacl_to_plan(movies_shacl)
-
-    rel_checks = [c for c in plan.checks if c.type == CheckType.RELATIONSHIP_CARDINALITY]
+    by_rel = {
+        (c.target_label, c.relationship.type): c
+        for c in plan_index.by_type[CheckType.RELATIONSHIP_CARDINALITY]
+    }
+
+    ha = by_rel[("Movie", "HAS_ACTOR")]
+    hd = by_rel[("Movie", "HAS_DIRECTOR")]
+    ro = by_rel[("Review", "REVIEW_OF")]
+    wb = by_rel[("Review", "WRITTEN_BY")]
+    assert (ha.min_count, ha.max_count) == (1, None)  # sh:minCount 1 -> 1..*
+    assert (hd.min_count, hd.max_count) == (1, None)  # sh:minCount 1 -> 1..*
+    assert (ro.min_count, ro.max_count) == (1, 1)  # sh:minCount 1, sh:maxCount 1 -> 1..1
+    assert (wb.min_count, wb.max_count) == (0, 1)  # sh:maxCount 1 -> 0..1
+
+
+def _assert_strict_invariants(plan):
+    """Check every strict-mode coverage check in a single pass over the plan."""
+    by_type = {}
+    for c in plan.checks:
+        if not c.id.startswith("strict-"):
+            continue
+        assert c.severity == Severity.WARNING, f"{c.id} should be a warning"
+        by_type.setdefault(c.type, []).append(c)
 
-    # hasActor: sh:minCount 1, no sh:maxCount -> 1..*
-    ha = [c for c in rel_checks if c.relationship.type == "HAS_ACTOR"][0]
-    assert ha.min_count == 1
-    assert ha.max_count is None
+    # 1 labels + 1 rels + 4 per-label props + 4 empty shapes
+    total = sum(len(v) for v in by_type.values())
+    assert total == 10, f"Expected 10 strict checks, got {total}"
 
-    # hasDirector: sh:minCount 1, no sh:maxCount -> 1..*
-    hd = [c for c in rel_checks if c.relationship.type == "HAS_DIRECTOR"][0]
-    assert hd.min_count == 1
-    assert hd.max_count is None
+    (labels_check,) = by_type[CheckType.UNDECLARED_LABELS]
+    assert set(labels_check.allowed_values) == _EXPECTED_LABELS
 
-    # writtenBy: no sh:minCount, sh:maxCount 1 -> 0..1
-    wb = [c for c in rel_checks if c.relationship.type == "WRITTEN_BY"][0]
-    assert wb.min_count == 0
-    assert wb.max_count == 1
+    (rels_check,) = by_type[CheckType.UNDECLARED_RELATIONSHIP_TYPES]
+    assert "HAS_ACTOR" in rels_check.allowed_relationships
 
+    props_checks = {c.target_label: c for c in by_type[CheckType.UNDECLARED_PROPERTIES]}
+    assert props_checks.keys() == _EXPECTED_LABELS
+    assert "title" in props_checks["Movie"].allowed_properties
 
-def test_shacl_strict_mode(movies_shacl):
-    """strict=True adds undeclared labels, rel types, per-label props, and empty shapes."""
-    plan = parse_shacl_to_plan(movies_shacl, strict=True)
+    empty_labels = {c.target_label for c in by_type[CheckType.EMPTY_SHAPE]}
+    assert empty_labels == _EXPECTED_LABELS
 
-    strict_checks = [c for c in plan.checks if c.id.startswith("strict-")]
-    # 1 labels + 1 rels + 4 per-label props + 4 empty shapes
-    assert len(strict_checks) == 10, f"Expected 10 strict checks, got {len(strict_checks)}"
 
-    label_checks = [c for c in strict_checks if c.type == CheckType.UNDECLARED_LABELS]
-    assert len(label_checks) == 1
-    assert set(label_checks[0].allowed_values) == {"Movie", "Person", "Genre", "Review"}
+def test_shacl_strict_mode(movies_shacl_plan_strict):
+    """strict=True adds undeclared labels, rel types, per-label props, and empty shapes."""
+    _assert_strict_invariants(movies_shacl_plan_strict)
 
 
-def test_shacl_strict_mode_off_by_default(movies_shacl):
+def test_shacl_strict_mode_off_by_default(movies_shacl_plan):
     """Without strict=True, no coverage checks are generated."""
-    plan = parse_shacl_to_plan(movies_shacl)
+    plan = movies_shacl_plan
     strict_checks = [c for c in plan.checks if c.id.startswith("strict-")]
     assert len(strict_checks) == 0
 
 
-def test_shacl_cypher_backend(movies_shacl):
+def test_shacl_cypher_backend(cypher_runnable):
     """Verify each SHACL check compiles to valid Cypher."""
-    plan = parse_shacl_to_plan(movies_shacl)
-    compiled = compile_plan(plan, CypherBackend())
-
-    for check, query in compiled:
-        if query.startswith("//"):
-            continue
-        assert "MATCH" in query or "OPTIONAL MATCH" in query, f"Query for {check.id} missing MATCH"
-        assert "RETURN" in query, f"Query for {check.id} missing RETURN"
-
-
-def test_shacl_gql_backend(movies_shacl):
+    bad = next(
+        ((check, query) for check, query in cypher_runnable if not _CYPHER_SHAPE.search(query)),
+        None,
+    )
+    assert bad is None, f"Query for {bad[0].id} is not MATCH ... RETURN node_id/rel_id:\n{bad[1]}"
+
+
+def _assert_gql_ids(runnable):
+    """Assert every runnable GQL query uses id() and none uses elementId()."""
+    # One scan of the joined text covers the common all-clean case.
+    blob = "\n".join(q for _, q in runnable)
+    if any(s in blob for s in _GQL_FORBIDDEN):
+        check, query = next(
+            (c, q) for c, q in runnable if any(s in q for s in _GQL_FORBIDDEN)
+        )
+        raise AssertionError(f"GQL query for {check.id} uses elementId:\n{query}")
+    bad = next(
+        ((c, q) for c, q in runnable if not any(s in q for s in _GQL_REQUIRED)),
+        None,
+    )
+    assert bad is None, f"GQL query for {bad[0].id} missing id():\n{bad[1]}"
+
+
+def test_shacl_gql_backend(gql_runnable):
     """Verify GQL backend uses id() not elementId()."""
-    plan = parse_shacl_to_plan(movies_shacl)
-    compiled = compile_plan(plan, GQLBackend())
+    _assert_gql_ids(gql_runnable)
 
-    for check, query in compiled:
-        if query.startswith("//"):
-            continue
-        assert "id(n)" in query or "id(startNode" in query, f"GQL query for {check.id} missing id()"
-        assert "elementId" not in query
 
-
-def test_shacl_dry_run(movies_shacl):
+def test_shacl_dry_run(movies_shacl_plan, cypher_compiled):
     """dry_run produces readable output."""
-    plan = parse_shacl_to_plan(movies_shacl)
-    output = dry_run(plan, CypherBackend())
+    plan = movies_shacl_plan
+    lines = list(dry_run_iter(plan, _CYPHER, precompiled=cypher_compiled))
 
-    assert len(output) > 0
-    assert "--" in output
-    assert "MATCH" in output
+    assert sum(1 for line in lines if "MATCH" in line) > 0
+    assert sum(1 for line in lines if line.startswith("--")) == 2 * len(plan.checks)
+    # Compiling on the fly gives the same output as reusing the shared pairs.
+    assert dry_run(plan, _CYPHER) == "\n".join(lines)
 
 
 def test_parse_schema_shacl(movies_shacl):
@@ -152,13 +210,42 @@ def test_parse_schema_shacl(movies_shacl):
     assert len(plan.shapes) == 4
 
 
+@pytest.mark.parametrize("iri,expected", [
+    ("http://example.org/movies#Movie", "Movie"),
+    ("http://example.org/movies/Person", "Person"),
+])
+def test_mapping_label_for(iri, expected):
+    assert _MAPPING.label_for(iri) == expected
+
+
+@pytest.mark.parametrize("iri,expected", [
+    ("http://example.org/movies#title", "title"),
+    ("http://example.org/movies#announcedYear", "announcedYear"),
+])
+def test_mapping_property_for(iri, expected):
+    assert _MAPPING.property_for(iri) == expected
+
+
+@pytest.mark.parametrize("iri,expected", [
+    ("http://example.org/movies#hasActor", "HAS_ACTOR"),
+    ("http://example.org/movies#writtenBy", "WRITTEN_BY"),
+    ("http://example.org/movies#reviewOf", "REVIEW_OF"),
+])
+def test_mapping_relationship_for(iri, expected):
+    assert _MAPPING.relationship_for(iri) == expected
+
+
+def test_mapping_relationship_override():
+    """Explicit overrides win over the camelCase -> UPPER_SNAKE convention."""
+    mapping = Mapping(
+        predicates_to_relationships={"http://example.org/movies#hasActor": "ACTED_IN"},
+    )
+    assert mapping.relationship_for("http://example.org/movies#hasActor") == "ACTED_IN"
+
+
 def test_shacl_severity_mapping():
     """sh:severity sh:Warning maps to Severity.WARNING."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
+    turtle = """
     ex:TestShape
         a sh:NodeShape ;
         sh:targetClass ex:Test ;
@@ -169,231 +256,135 @@ def test_shacl_severity_mapping():
             sh:severity sh:Warning ;
         ] .
     """
-    plan = parse_shacl_to_plan(turtle)
+    plan = _quick_plan(turtle)
     assert len(plan.checks) > 0
     for c in plan.checks:
         assert c.severity == Severity.WARNING
 
 
-def test_shacl_malformed_no_path():
-    """Property shape with no sh:path is silently skipped."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+def test_shacl_mapping_overrides():
+    """Explicit Mapping overrides apply to SHACL IRIs.
 
+    rdflib's URIRef never compares equal to a plain str, so the parser must
+    hand plain strings to Mapping for the override dicts to match.
+    """
+    turtle = """
     ex:TestShape
         a sh:NodeShape ;
         sh:targetClass ex:Test ;
         sh:property [
+            sh:path ex:name ;
             sh:datatype xsd:string ;
             sh:minCount 1 ;
+        ] ;
+        sh:property [
+            sh:path ex:knows ;
+            sh:class ex:Test ;
         ] .
     """
-    plan = parse_shacl_to_plan(turtle)
-    assert len(plan.checks) == 0
-
+    mapping = Mapping(
+        classes_to_labels={"http://example.org/test#Test": "TestNode"},
+        predicates_to_properties={"http://example.org/test#name": "full_name"},
+        predicates_to_relationships={"http://example.org/test#knows": "KNOWS"},
+    )
+    plan = _quick_plan(turtle, mapping=mapping)
 
-# ─── Tier 1: New SHACL Core constraints ──────────────────────────────
+    assert {c.target_label for c in plan.checks} == {"TestNode"}
+    props = {c.property for c in plan.checks if c.property}
+    assert props == {"full_name"}
+    rel = _exactly_one(c for c in plan.checks if c.type == CheckType.RELATIONSHIP_CARDINALITY)
+    assert rel.relationship.type == "KNOWS"
+    assert rel.relationship.target_label == "TestNode"
 
 
-def test_shacl_pattern():
-    """sh:pattern produces PROPERTY_PATTERN check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
+def test_shacl_malformed_no_path():
+    """Property shape with no sh:path is silently skipped."""
+    turtle = """
     ex:TestShape
         a sh:NodeShape ;
         sh:targetClass ex:Test ;
         sh:property [
-            sh:path ex:name ;
             sh:datatype xsd:string ;
-            sh:pattern "^[A-Z]" ;
-            sh:flags "i" ;
+            sh:minCount 1 ;
         ] .
     """
-    plan = parse_shacl_to_plan(turtle)
-    pattern_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_PATTERN]
-    assert len(pattern_checks) == 1
-    assert pattern_checks[0].pattern == "^[A-Z]"
-    assert pattern_checks[0].pattern_flags == "i"
-
-    # Verify Cypher compilation
-    query = CypherBackend().compile_check(pattern_checks[0])
-    assert "=~" in query
-    assert "(?i)" in query
-
-    # Verify GQL compilation
-    query_gql = GQLBackend().compile_check(pattern_checks[0])
-    assert "=~" in query_gql
-    assert "id(n)" in query_gql
+    plan = _quick_plan(turtle)
+    assert len(plan.checks) == 0
 
 
-def test_shacl_pattern_no_flags():
-    """sh:pattern without sh:flags works correctly."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
+# ─── Tier 1/2: Single-constraint property shapes ─────────────────────
+#
+# Each shape targets its own class, so one parse serves every case below
+# and checks are told apart by target_label.
 
-    ex:TestShape
+_MICRO_TTL = _PREFIXES + """
+    ex:PatternShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:Pattern ;
+        sh:property [
+            sh:path ex:name ;
+            sh:datatype xsd:string ;
+            sh:pattern "^[A-Z]" ;
+            sh:flags "i" ;
+        ] .
+
+    ex:PatternNoFlagsShape
+        a sh:NodeShape ;
+        sh:targetClass ex:PatternNoFlags ;
         sh:property [
             sh:path ex:code ;
             sh:pattern "^[A-Z]{3}$" ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    pattern_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_PATTERN]
-    assert len(pattern_checks) == 1
-    assert pattern_checks[0].pattern_flags is None
 
-    query = CypherBackend().compile_check(pattern_checks[0])
-    assert "(?i)" not in query
-
-
-def test_shacl_string_length():
-    """sh:minLength/maxLength produces PROPERTY_STRING_LENGTH check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-    ex:TestShape
+    ex:StrLenShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:StrLen ;
         sh:property [
             sh:path ex:bio ;
             sh:datatype xsd:string ;
             sh:minLength 10 ;
             sh:maxLength 500 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    len_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_STRING_LENGTH]
-    assert len(len_checks) == 1
-    assert len_checks[0].min_length == 10
-    assert len_checks[0].max_length == 500
-
-    query = CypherBackend().compile_check(len_checks[0])
-    assert "size(n.bio)" in query
-    assert "< 10" in query
-    assert "> 500" in query
-
 
-def test_shacl_string_length_min_only():
-    """sh:minLength alone works."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-
-    ex:TestShape
+    ex:StrLenMinShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:StrLenMin ;
         sh:property [
             sh:path ex:name ;
             sh:minLength 1 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    len_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_STRING_LENGTH]
-    assert len(len_checks) == 1
-    assert len_checks[0].min_length == 1
-    assert len_checks[0].max_length is None
 
-
-def test_shacl_range():
-    """sh:minInclusive/maxInclusive produces PROPERTY_RANGE check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-    ex:TestShape
+    ex:RangeShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:Range ;
         sh:property [
             sh:path ex:year ;
             sh:datatype xsd:integer ;
             sh:minInclusive 1888 ;
             sh:maxInclusive 2100 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    range_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_RANGE]
-    assert len(range_checks) == 1
-    assert range_checks[0].min_inclusive == 1888.0
-    assert range_checks[0].max_inclusive == 2100.0
-
-    query = CypherBackend().compile_check(range_checks[0])
-    assert "< 1888.0" in query
-    assert "> 2100.0" in query
-
-
-def test_shacl_range_exclusive():
-    """sh:minExclusive/maxExclusive produces correct conditions."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
 
-    ex:TestShape
+    ex:RangeExclusiveShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:RangeExclusive ;
         sh:property [
             sh:path ex:score ;
             sh:datatype xsd:float ;
             sh:minExclusive 0.0 ;
             sh:maxExclusive 10.0 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    range_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_RANGE]
-    assert len(range_checks) == 1
-    assert range_checks[0].min_exclusive == 0.0
-    assert range_checks[0].max_exclusive == 10.0
-
-    query = CypherBackend().compile_check(range_checks[0])
-    assert "<= 0.0" in query
-    assert ">= 10.0" in query
 
-
-def test_shacl_has_value():
-    """sh:hasValue reuses PROPERTY_VALUE_IN with single value."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-    ex:TestShape
+    ex:HasValueShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:HasValue ;
         sh:property [
             sh:path ex:status ;
             sh:hasValue "active" ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    value_checks = [
-        c for c in plan.checks
-        if c.type == CheckType.PROPERTY_VALUE_IN and "hasvalue" in c.id
-    ]
-    assert len(value_checks) == 1
-    assert value_checks[0].allowed_values == ["active"]
-
-
-def test_shacl_closed_shape():
-    """sh:closed with sh:ignoredProperties produces UNDECLARED_PROPERTIES check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
 
-    ex:TestShape
+    ex:ClosedShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:Closed ;
         sh:closed true ;
         sh:ignoredProperties ( ex:internalId ) ;
         sh:property [
@@ -405,220 +396,77 @@ def test_shacl_closed_shape():
             sh:path ex:age ;
             sh:datatype xsd:integer ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    closed_checks = [
-        c for c in plan.checks if c.type == CheckType.UNDECLARED_PROPERTIES
-    ]
-    assert len(closed_checks) == 1
-    assert "name" in closed_checks[0].allowed_properties
-    assert "age" in closed_checks[0].allowed_properties
-    assert "internalId" in closed_checks[0].allowed_properties
 
-    query = CypherBackend().compile_check(closed_checks[0])
-    assert "keys(n)" in query
-
-
-def test_shacl_closed_false_no_check():
-    """sh:closed false does not generate undeclared properties check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-
-    ex:TestShape
+    ex:OpenShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:Open ;
         sh:closed false ;
         sh:property [
             sh:path ex:name ;
             sh:minCount 1 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    closed_checks = [
-        c for c in plan.checks if c.type == CheckType.UNDECLARED_PROPERTIES
-    ]
-    assert len(closed_checks) == 0
-
 
-def test_shacl_annotation_properties():
-    """sh:defaultValue and sh:order are parsed as metadata."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-    ex:TestShape
+    ex:AnnotatedShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:Annotated ;
         sh:property [
             sh:path ex:status ;
             sh:datatype xsd:string ;
             sh:defaultValue "draft" ;
             sh:order 1 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    # The type check should have annotation metadata
-    type_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_TYPE]
-    assert len(type_checks) == 1
-    assert type_checks[0].default_value == "draft"
-    assert type_checks[0].display_order == 1
-
-
-# ─── Tier 2: SHACL-Unique features ──────────────────────────────────
-
-
-def test_shacl_property_pair_less_than():
-    """sh:lessThan produces PROPERTY_PAIR check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
 
-    ex:TestShape
+    ex:PairLessThanShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:PairLessThan ;
         sh:property [
             sh:path ex:startDate ;
             sh:datatype xsd:integer ;
             sh:lessThan ex:endDate ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    pair_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_PAIR]
-    assert len(pair_checks) == 1
-    assert pair_checks[0].property == "startDate"
-    assert pair_checks[0].compare_property == "endDate"
-    assert pair_checks[0].comparison_type == "lessThan"
-
-    query = CypherBackend().compile_check(pair_checks[0])
-    assert "n.startDate" in query
-    assert "n.endDate" in query
-    assert "NOT (n.startDate < n.endDate)" in query
 
-
-def test_shacl_property_pair_equals():
-    """sh:equals produces PROPERTY_PAIR check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-
-    ex:TestShape
+    ex:PairEqualsShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:PairEquals ;
         sh:property [
             sh:path ex:email ;
             sh:equals ex:primaryEmail ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    pair_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_PAIR]
-    assert len(pair_checks) == 1
-    assert pair_checks[0].comparison_type == "equals"
-
-    query = CypherBackend().compile_check(pair_checks[0])
-    assert "<>" in query
-
 
-def test_shacl_property_pair_disjoint():
-    """sh:disjoint produces PROPERTY_PAIR check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-
-    ex:TestShape
+    ex:PairDisjointShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:PairDisjoint ;
         sh:property [
             sh:path ex:name ;
             sh:disjoint ex:nickname ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    pair_checks = [c for c in plan.checks if c.type == CheckType.PROPERTY_PAIR]
-    assert len(pair_checks) == 1
-    assert pair_checks[0].comparison_type == "disjoint"
-
-    query = CypherBackend().compile_check(pair_checks[0])
-    assert "n.name = n.nickname" in query
-
 
-def test_shacl_inverse_path():
-    """sh:inversePath sets relationship direction to incoming."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-
-    ex:PersonShape
+    ex:InversePathShape
         a sh:NodeShape ;
-        sh:targetClass ex:Person ;
+        sh:targetClass ex:InverseActor ;
         sh:property [
             sh:path [ sh:inversePath ex:hasActor ] ;
             sh:nodeKind sh:IRI ;
             sh:class ex:Movie ;
             sh:minCount 1 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    rel_checks = [c for c in plan.checks if c.type == CheckType.RELATIONSHIP_CARDINALITY]
-    assert len(rel_checks) == 1
-    assert rel_checks[0].relationship.direction == "incoming"
-    assert rel_checks[0].relationship.type == "HAS_ACTOR"
-    assert rel_checks[0].relationship.target_label == "Movie"
-
-    query = CypherBackend().compile_check(rel_checks[0])
-    assert "<-[" in query  # incoming direction
-
-
-def test_shacl_class_hierarchy():
-    """rdfs:subClassOf creates acceptable_labels for relationship checks."""
-    turtle = """\
-    @prefix sh:   <http://www.w3.org/ns/shacl#> .
-    @prefix ex:   <http://example.org/test#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
 
     ex:Dog rdfs:subClassOf ex:Animal .
     ex:Cat rdfs:subClassOf ex:Animal .
 
-    ex:PersonShape
+    ex:PetOwnerShape
         a sh:NodeShape ;
-        sh:targetClass ex:Person ;
+        sh:targetClass ex:PetOwner ;
         sh:property [
             sh:path ex:hasPet ;
             sh:nodeKind sh:IRI ;
             sh:class ex:Animal ;
             sh:minCount 1 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    rel_checks = [c for c in plan.checks if c.type == CheckType.RELATIONSHIP_CARDINALITY]
-    assert len(rel_checks) == 1
-
-    # Should have acceptable_labels including Animal + its subclasses
-    assert rel_checks[0].acceptable_labels is not None
-    assert "Animal" in rel_checks[0].acceptable_labels
-    assert "Dog" in rel_checks[0].acceptable_labels
-    assert "Cat" in rel_checks[0].acceptable_labels
-
-    query = CypherBackend().compile_check(rel_checks[0])
-    assert "labels(t)" in query
-    assert "'Animal'" in query
-
-
-# ─── Tier 3: Complex features ───────────────────────────────────────
 
-
-def test_shacl_qualified_cardinality():
-    """sh:qualifiedValueShape with sh:qualifiedMinCount produces QUALIFIED_CARDINALITY check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-    ex:TestShape
+    ex:QualifiedShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:Qualified ;
         sh:property [
             sh:path ex:score ;
             sh:qualifiedValueShape [
@@ -627,57 +475,207 @@ def test_shacl_qualified_cardinality():
             sh:qualifiedMinCount 1 ;
             sh:qualifiedMaxCount 5 ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    qc_checks = [c for c in plan.checks if c.type == CheckType.QUALIFIED_CARDINALITY]
-    assert len(qc_checks) == 1
-    assert qc_checks[0].qualified_min == 1
-    assert qc_checks[0].qualified_max == 5
-    assert qc_checks[0].qualified_filter is not None
-    assert qc_checks[0].qualified_filter.expected_type == "integer"
+"""
+
+# (target label, check type, expected attributes, Cypher must contain, Cypher must not contain)
+# Attribute names may be dotted paths; set-valued expectations are compared
+# order-insensitively.
+_MICRO_CASES = [
+    pytest.param(
+        "Pattern", CheckType.PROPERTY_PATTERN,
+        {"pattern": "^[A-Z]", "pattern_flags": "i"},
+        ("=~", "(?i)"), (),
+        id="pattern",
+    ),
+    pytest.param(
+        "PatternNoFlags", CheckType.PROPERTY_PATTERN,
+        {"pattern_flags": None},
+        (), ("(?i)",),
+        id="pattern-no-flags",
+    ),
+    pytest.param(
+        "StrLen", CheckType.PROPERTY_STRING_LENGTH,
+        {"min_length": 10, "max_length": 500},
+        ("size(n.bio)", "< 10", "> 500"), (),
+        id="string-length",
+    ),
+    pytest.param(
+        "StrLenMin", CheckType.PROPERTY_STRING_LENGTH,
+        {"min_length": 1, "max_length": None},
+        (), (),
+        id="string-length-min-only",
+    ),
+    pytest.param(
+        "Range", CheckType.PROPERTY_RANGE,
+        {"min_inclusive": 1888.0, "max_inclusive": 2100.0},
+        ("< 1888.0", "> 2100.0"), (),
+        id="range",
+    ),
+    pytest.param(
+        "RangeExclusive", CheckType.PROPERTY_RANGE,
+        {"min_exclusive": 0.0, "max_exclusive": 10.0},
+        ("<= 0.0", ">= 10.0"), (),
+        id="range-exclusive",
+    ),
+    pytest.param(
+        "HasValue", CheckType.PROPERTY_VALUE_IN,
+        {"allowed_values": ["active"]},
+        (), (),
+        id="has-value",
+    ),
+    pytest.param(
+        "Closed", CheckType.UNDECLARED_PROPERTIES,
+        {"allowed_properties": {"name", "age", "internalId"}},
+        ("keys(n)",), (),
+        id="closed-shape",
+    ),
+    pytest.param(
+        "Annotated", CheckType.PROPERTY_TYPE,
+        {"default_value": "draft", "display_order": 1},
+        (), (),
+        id="annotation-properties",
+    ),
+    pytest.param(
+        "PairLessThan", CheckType.PROPERTY_PAIR,
+        {"property": "startDate", "compare_property": "endDate", "comparison_type": "lessThan"},
+        ("n.startDate", "n.endDate", "NOT (n.startDate < n.endDate)"), (),
+        id="pair-less-than",
+    ),
+    pytest.param(
+        "PairEquals", CheckType.PROPERTY_PAIR,
+        {"comparison_type": "equals"},
+        ("<>",), (),
+        id="pair-equals",
+    ),
+    pytest.param(
+        "PairDisjoint", CheckType.PROPERTY_PAIR,
+        {"comparison_type": "disjoint"},
+        ("n.name = n.nickname",), (),
+        id="pair-disjoint",
+    ),
+    pytest.param(
+        "InverseActor", CheckType.RELATIONSHIP_CARDINALITY,
+        {
+            "relationship.direction": "incoming",
+            "relationship.type": "HAS_ACTOR",
+            "relationship.target_label": "Movie",
+        },
+        ("<-[",), (),
+        id="inverse-path",
+    ),
+    pytest.param(
+        "PetOwner", CheckType.RELATIONSHIP_CARDINALITY,
+        {"acceptable_labels": {"Animal", "Dog", "Cat"}},
+        ("labels(t)", "'Animal'"), (),
+        id="class-hierarchy",
+    ),
+    pytest.param(
+        "Qualified", CheckType.QUALIFIED_CARDINALITY,
+        {"qualified_min": 1, "qualified_max": 5, "qualified_filter.expected_type": "integer"},
+        ("qcount",), (),
+        id="qualified-cardinality",
+    ),
+]
+
+
+def _checks_for(plan, label, check_type):
+    return [c for c in plan.checks if c.target_label == label and c.type == check_type]
+
+
+def _assert_cypher(check, has=(), lacks=()):
+    query = _CYPHER.compile_check(check)
+    for needle in has:
+        assert needle in query, f"{check.id}: missing {needle!r}"
+    for needle in lacks:
+        assert needle not in query, f"{check.id}: unexpected {needle!r}"
+
+
+@pytest.fixture(scope="module")
+def micro_plan():
+    return parse_shacl_to_plan(_MICRO_TTL)
+
+
+@pytest.mark.parametrize("label,check_type,attrs,cypher_has,cypher_lacks", _MICRO_CASES)
+def test_shacl_single_constraint(micro_plan, label, check_type, attrs, cypher_has, cypher_lacks):
+    """Each single-constraint shape yields exactly one check of the expected type."""
+    (check,) = _checks_for(micro_plan, label, check_type)
+
+    for name, expected in attrs.items():
+        actual = attrgetter(name)(check)
+        if isinstance(expected, set):
+            actual = set(actual)
+        assert actual == expected, f"{check.id}.{name}"
+
+    _assert_cypher(check, cypher_has, cypher_lacks)
+
+
+def test_shacl_pattern_gql(micro_plan):
+    """sh:pattern compiles to a GQL regex match."""
+    (check,) = _checks_for(micro_plan, "Pattern", CheckType.PROPERTY_PATTERN)
+    query_gql = _GQL.compile_check(check)
+    assert "=~" in query_gql
+    assert "id(n)" in query_gql
 
-    query = CypherBackend().compile_check(qc_checks[0])
-    assert "qcount" in query
 
+def test_shacl_closed_false_no_check(micro_plan):
+    """sh:closed false does not generate undeclared properties check."""
+    assert _checks_for(micro_plan, "Open", CheckType.UNDECLARED_PROPERTIES) == []
 
-def test_shacl_logical_not():
-    """sh:not produces LOGICAL_NOT check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
 
-    ex:TestShape
+# ─── Tier 3: Complex features ───────────────────────────────────────
+
+
+_LOGICAL_TTL = _PREFIXES + """
+    ex:NotShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
+        sh:targetClass ex:Not ;
         sh:not [
             sh:property [
                 sh:path ex:status ;
                 sh:pattern "^deleted" ;
             ] ;
         ] .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    not_checks = [c for c in plan.checks if c.type == CheckType.LOGICAL_NOT]
-    assert len(not_checks) == 1
-    assert len(not_checks[0].sub_checks) == 1
-
-    query = CypherBackend().compile_check(not_checks[0])
-    assert "MATCH" in query
-    assert "=~" in query
 
+    ex:OrShape
+        a sh:NodeShape ;
+        sh:targetClass ex:Or ;
+        sh:or (
+            [
+                sh:property [
+                    sh:path ex:email ;
+                    sh:minCount 1 ;
+                ] ;
+            ]
+            [
+                sh:property [
+                    sh:path ex:phone ;
+                    sh:minCount 1 ;
+                ] ;
+            ]
+        ) .
 
-def test_shacl_logical_or():
-    """sh:or produces LOGICAL_OR check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+    ex:AndShape
+        a sh:NodeShape ;
+        sh:targetClass ex:And ;
+        sh:and (
+            [
+                sh:property [
+                    sh:path ex:name ;
+                    sh:minCount 1 ;
+                ] ;
+            ]
+            [
+                sh:property [
+                    sh:path ex:age ;
+                    sh:minCount 1 ;
+                ] ;
+            ]
+        ) .
 
-    ex:TestShape
+    ex:XoneShape
         a sh:NodeShape ;
-        sh:targetClass ex:Test ;
-        sh:or (
+        sh:targetClass ex:Xone ;
+        sh:xone (
             [
                 sh:property [
                     sh:path ex:email ;
@@ -691,14 +689,28 @@ def test_shacl_logical_or():
                 ] ;
             ]
         ) .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    or_checks = [c for c in plan.checks if c.type == CheckType.LOGICAL_OR]
-    assert len(or_checks) == 1
-    assert len(or_checks[0].sub_checks) == 2
+"""
+
 
-    query = CypherBackend().compile_check(or_checks[0])
-    assert "AND" in query  # sh:or violations use AND (all must fail)
+@pytest.fixture(scope="module")
+def logical_plan():
+    return parse_shacl_to_plan(_LOGICAL_TTL)
+
+
+# (target label, check type, sub-check count, Cypher must contain)
+# Violations invert the operator: sh:or fails when every branch fails (AND),
+# sh:and fails when any branch fails (OR).
+@pytest.mark.parametrize("label,check_type,sub_count,cypher_has", [
+    pytest.param("Not", CheckType.LOGICAL_NOT, 1, ("MATCH", "=~"), id="not"),
+    pytest.param("Or", CheckType.LOGICAL_OR, 2, ("AND",), id="or"),
+    pytest.param("And", CheckType.LOGICAL_AND, 2, ("OR",), id="and"),
+    pytest.param("Xone", CheckType.LOGICAL_XONE, 2, ("satisfied_count", "<> 1"), id="xone"),
+])
+def test_shacl_logical(logical_plan, label, check_type, sub_count, cypher_has):
+    """sh:not / sh:or / sh:and / sh:xone each produce one logical check."""
+    (check,) = _checks_for(logical_plan, label, check_type)
+    assert len(check.sub_checks) == sub_count
+    _assert_cypher(check, cypher_has)
 
 
 def test_shacl_logical_or_with_relationships():
@@ -706,10 +718,7 @@ def test_shacl_logical_or_with_relationships():
     RELATIONSHIP_CARDINALITY sub-checks, not PROPERTY_EXISTS — so movies
     with the relationship actually satisfy the OR.
     """
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/movies#> .
-
+    turtle = """
     ex:PersonShape
         a sh:NodeShape ;
         sh:targetClass ex:Person .
@@ -730,10 +739,9 @@ def test_shacl_logical_or_with_relationships():
             ] ]
         ) .
     """
-    plan = parse_shacl_to_plan(turtle)
-    or_checks = [c for c in plan.checks if c.type == CheckType.LOGICAL_OR]
-    assert len(or_checks) == 1
-    subs = or_checks[0].sub_checks
+    plan = _quick_plan(turtle)
+    or_check = _exactly_one(c for c in plan.checks if c.type == CheckType.LOGICAL_OR)
+    subs = or_check.sub_checks
     assert len(subs) == 2
     assert all(s.type == CheckType.RELATIONSHIP_CARDINALITY for s in subs)
     rel_types = {s.relationship.type for s in subs}
@@ -742,87 +750,15 @@ def test_shacl_logical_or_with_relationships():
         assert s.relationship.target_label == "Person"
         assert s.min_count == 1
 
-    query = CypherBackend().compile_check(or_checks[0])
+    query = _CYPHER.compile_check(or_check)
     # Each branch should compile to an EXISTS subquery on the relationship
     assert "EXISTS { (n)-[:HAS_ACTOR]->(:Person) }" in query
     assert "EXISTS { (n)-[:HAS_DIRECTOR]->(:Person) }" in query
 
 
-def test_shacl_logical_and():
-    """sh:and produces LOGICAL_AND check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-    ex:TestShape
-        a sh:NodeShape ;
-        sh:targetClass ex:Test ;
-        sh:and (
-            [
-                sh:property [
-                    sh:path ex:name ;
-                    sh:minCount 1 ;
-                ] ;
-            ]
-            [
-                sh:property [
-                    sh:path ex:age ;
-                    sh:minCount 1 ;
-                ] ;
-            ]
-        ) .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    and_checks = [c for c in plan.checks if c.type == CheckType.LOGICAL_AND]
-    assert len(and_checks) == 1
-    assert len(and_checks[0].sub_checks) == 2
-
-    query = CypherBackend().compile_check(and_checks[0])
-    assert "OR" in query  # sh:and violations use OR (any failure)
-
-
-def test_shacl_logical_xone():
-    """sh:xone produces LOGICAL_XONE check."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-    ex:TestShape
-        a sh:NodeShape ;
-        sh:targetClass ex:Test ;
-        sh:xone (
-            [
-                sh:property [
-                    sh:path ex:email ;
-                    sh:minCount 1 ;
-                ] ;
-            ]
-            [
-                sh:property [
-                    sh:path ex:phone ;
-                    sh:minCount 1 ;
-                ] ;
-            ]
-        ) .
-    """
-    plan = parse_shacl_to_plan(turtle)
-    xone_checks = [c for c in plan.checks if c.type == CheckType.LOGICAL_XONE]
-    assert len(xone_checks) == 1
-    assert len(xone_checks[0].sub_checks) == 2
-
-    query = CypherBackend().compile_check(xone_checks[0])
-    assert "satisfied_count" in query
-    assert "<> 1" in query
-
-
 def test_shacl_unique_lang():
     """sh:uniqueLang emits INFO-level check and warning."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-
+    turtle = """
     ex:TestShape
         a sh:NodeShape ;
         sh:targetClass ex:Test ;
@@ -831,33 +767,27 @@ def test_shacl_unique_lang():
             sh:uniqueLang true ;
         ] .
     """
-    import warnings
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
-        plan = parse_shacl_to_plan(turtle)
+        plan = _quick_plan(turtle)
 
-    lang_checks = [c for c in plan.checks if c.type == CheckType.UNIQUE_LANG]
-    assert len(lang_checks) == 1
-    assert lang_checks[0].severity == Severity.INFO
+    lang_check = _exactly_one(c for c in plan.checks if c.type == CheckType.UNIQUE_LANG)
+    assert lang_check.severity == Severity.INFO
 
     # Should have emitted a warning
     assert any("uniqueLang" in str(warning.message) for warning in w)
 
     # Backend produces comment
-    query = CypherBackend().compile_check(lang_checks[0])
+    query = _CYPHER.compile_check(lang_check)
     assert query.startswith("//")
 
 
 # ─── Backend negative tests ──────────────────────────────────────────
 
 
-def test_shacl_new_checks_gql_compilation():
+def test_shacl_new_checks_gql_compilation(runnable):
     """Verify all SHACL-unique checks compile to GQL with element_id()."""
-    turtle = """\
-    @prefix sh: <http://www.w3.org/ns/shacl#> .
-    @prefix ex: <http://example.org/test#> .
-    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
+    turtle = """
     ex:TestShape
         a sh:NodeShape ;
         sh:targetClass ex:Test ;
@@ -877,24 +807,15 @@ def test_shacl_new_checks_gql_compilation():
             sh:lessThan ex:maxScore ;
         ] .
     """
-    plan = parse_shacl_to_plan(turtle)
-    gql = GQLBackend()
-
-    for check in plan.checks:
-        query = gql.compile_check(check)
-        if query.startswith("//"):
-            continue
-        assert "id(n)" in query or "id(startNode" in query, f"GQL query for {check.id} missing id()"
-        assert "elementId" not in query, f"GQL query for {check.id} has Cypher's elementId"
+    plan = _quick_plan(turtle)
+    _assert_gql_ids(runnable(compile_plan(plan, _GQL)))
 
 
-def test_movies_shacl_new_constraints(movies_shacl):
+def test_movies_shacl_new_constraints(movies_shacl_plan):
     """Updated movies.shacl.ttl produces checks for new constraint types."""
-    plan = parse_shacl_to_plan(movies_shacl)
+    plan = movies_shacl_plan
 
-    type_counts = {}
-    for c in plan.checks:
-        type_counts[c.type] = type_counts.get(c.type, 0) + 1
+    type_counts = Counter(c.type for c in plan.checks)
 
     # Released has sh:minInclusive/maxInclusive, score has sh:minExclusive/maxExclusive
     assert type_counts.get(CheckType.PROPERTY_RANGE, 0) >= 2